@@ -61,7 +61,10 @@ apt-get update
 apt-get install -y curl jq htop iotop nethogs python3-pip
 
 # Install Python monitoring packages
-pip3 install psutil nvidia-ml-py3 prometheus-client flask requests
+# nvidia-ml-py is NVIDIA's maintained NVML binding; the older nvidia-ml-py3 fork
+# ships the same pynvml module but lacks batched field queries
+pip3 uninstall -y nvidia-ml-py3 >/dev/null 2>&1 || true
+pip3 install psutil nvidia-ml-py prometheus-client flask requests orjson
 
 # Create monitoring configuration
 cat > /etc/vllm/monitoring/monitor.conf << EOF
@@ -92,10 +95,23 @@ ENABLE_SLACK_ALERTS=false
 SLACK_WEBHOOK=""
 ENABLE_EMAIL_ALERTS=false
 EMAIL_RECIPIENTS=""
+# Send email directly over SMTP; leave SMTP_HOST empty to use the system mail command
+SMTP_HOST=""
+SMTP_PORT=25
+SMTP_USER=""
+SMTP_PASSWORD=""
+SMTP_FROM=""
+SMTP_STARTTLS=false
+# Repeat alerts back off from ALERT_COOLDOWN up to ALERT_MAX_COOLDOWN (seconds)
+ALERT_COOLDOWN=3600
+ALERT_MAX_COOLDOWN=86400
 
 # Logging
 LOG_LEVEL="INFO"
 RETAIN_LOGS_DAYS=30
+
+# Flush the metrics file every N records (the dashboard reads the last line)
+METRICS_FLUSH_RECORDS=1
 EOF
 
 success "Monitoring configuration created"
@@ -291,8 +307,7 @@ def get_recent_logs():
     if not log_dir.exists():
         return ""
     
-    today = datetime.now().strftime('%Y-%m-%d')
-    log_file = log_dir / f"health-monitor-{today}.log"
+    log_file = log_dir / "health-monitor.log"
     
     if not log_file.exists():
         return ""
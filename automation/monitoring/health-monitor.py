@@ -6,34 +6,103 @@ Monitors API health, GPU utilization, system resources, and performance metrics
 
 import os
 import sys
+import atexit
+import asyncio
 import json
 import time
 import logging
+import logging.handlers
+import smtplib
+import socket
 import requests
+from requests.adapters import HTTPAdapter
 import psutil
 import subprocess
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import configparser
+from email.message import EmailMessage
+from collections import OrderedDict, deque
 
 try:
-    import pynvml
+    import pynvml  # from the nvidia-ml-py package
     NVIDIA_AVAILABLE = True
 except ImportError:
     NVIDIA_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shortest window a CPU usage reading may cover, in seconds
+MIN_CPU_SAMPLE_SECONDS = 1.0
+
+# Maximum number of distinct alerts tracked for rate limiting
+ALERT_HISTORY_SIZE = 256
+
+# Longest run of health checks that skip the generation test after repeated failures
+MAX_GENERATION_SKIP_CYCLES = 8
+
+# Performance samples kept in memory (24h at a 60s cadence)
+PERFORMANCE_HISTORY_SIZE = 1440
+
+# Value types for known config keys; anything else is kept as a string
+CONFIG_TYPES = {
+    'HEALTH_CHECK_INTERVAL': int,
+    'PERFORMANCE_CHECK_INTERVAL': int,
+    'GPU_CHECK_INTERVAL': int,
+    'SYSTEM_CHECK_INTERVAL': int,
+    'GPU_MEMORY_THRESHOLD': float,
+    'GPU_TEMP_THRESHOLD': float,
+    'CPU_THRESHOLD': float,
+    'MEMORY_THRESHOLD': float,
+    'DISK_THRESHOLD': float,
+    'API_RESPONSE_THRESHOLD': float,
+    'GENERATION_TIME_THRESHOLD': float,
+    'RETAIN_LOGS_DAYS': int,
+    'METRICS_FLUSH_RECORDS': int,
+    'ALERT_COOLDOWN': int,
+    'ALERT_MAX_COOLDOWN': int,
+    'SMTP_PORT': int,
+    'SMTP_STARTTLS': bool,
+    'ENABLE_SLACK_ALERTS': bool,
+    'ENABLE_EMAIL_ALERTS': bool,
+}
+
 class VLLMHealthMonitor:
     def __init__(self, config_file: str = "/etc/vllm/monitoring/monitor.conf"):
         self.config_file = config_file
         self.config = self.load_config()
         self.setup_logging()
         self.setup_nvidia()
+        self.setup_http()
+        
+        # Prime CPU sampling so each check reports usage since the previous one
+        psutil.cpu_percent(interval=None)
+        self.cpu_sampled_at = time.monotonic()
         
         # Monitoring state
         self.last_checks = {}
-        self.alert_counts = {}
-        self.performance_history = []
+        self.alert_counts = OrderedDict()  # title -> (last sent, repeat count)
+        self.alert_lock = threading.Lock()
+        self.smtp = None
+        self.smtp_lock = threading.Lock()
+        self.performance_history = deque(maxlen=PERFORMANCE_HISTORY_SIZE)
+        self.vllm_procs = {}  # pid -> psutil.Process, kept for cpu_percent deltas
+        self.generation_failures = 0
+        self.generation_skip_cycles = 0
+        
+        # Metrics file stays open until the date changes
+        self.metrics_dir = Path(self.config['MONITORING_ROOT']) / 'data'
+        self.metrics_dir.mkdir(parents=True, exist_ok=True)
+        self.metrics_file = None
+        self.metrics_date = None
+        self.unflushed_records = 0
         
     def load_config(self) -> Dict[str, Any]:
         """Load monitoring configuration"""
@@ -53,28 +122,55 @@ class VLLMHealthMonitor:
             'API_RESPONSE_THRESHOLD': 5.0,
             'GENERATION_TIME_THRESHOLD': 30.0,
             'LOG_LEVEL': 'INFO',
+            'RETAIN_LOGS_DAYS': 30,
+            'METRICS_FLUSH_RECORDS': 1,
             'ENABLE_SLACK_ALERTS': False,
             'ENABLE_EMAIL_ALERTS': False,
+            'ALERT_COOLDOWN': 3600,
+            'ALERT_MAX_COOLDOWN': 86400,
+            'SMTP_HOST': '',
+            'SMTP_PORT': 25,
+            'SMTP_USER': '',
+            'SMTP_PASSWORD': '',
+            'SMTP_FROM': '',
+            'SMTP_STARTTLS': False,
         }
         
         if os.path.exists(self.config_file):
+            # The file is shell-style KEY=value without sections, so parse it
+            # as the DEFAULT section of an INI document. Lines that are not
+            # assignments are skipped, and "# ..." after a value is a comment.
             with open(self.config_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"')
-                        
-                        # Convert to appropriate type
-                        if value.lower() in ('true', 'false'):
-                            config[key] = value.lower() == 'true'
-                        elif value.isdigit():
-                            config[key] = int(value)
-                        elif '.' in value and value.replace('.', '').isdigit():
-                            config[key] = float(value)
-                        else:
-                            config[key] = value
+                lines = [
+                    line.strip() for line in f
+                    if '=' in line and not line.lstrip().startswith('#')
+                ]
+                
+            parser = configparser.ConfigParser(
+                delimiters=('=',),
+                inline_comment_prefixes=('#',),
+                interpolation=None,
+                strict=False
+            )
+            parser.optionxform = str
+            try:
+                parser.read_string(f"[{configparser.DEFAULTSECT}]\n" + "\n".join(lines))
+            except configparser.Error as e:
+                sys.exit(f"Error parsing config file {self.config_file}: {e}")
+            
+            for key, value in parser.defaults().items():
+                value = value.strip('"')
+                value_type = CONFIG_TYPES.get(key, str)
+                
+                try:
+                    if value_type is bool:
+                        config[key] = parser.BOOLEAN_STATES[value.lower()]
+                    else:
+                        config[key] = value_type(value)
+                except (KeyError, ValueError):
+                    # Logging is not set up yet; keep the default and carry on
+                    print(f"Warning: invalid value for {key} in {self.config_file}: {value!r}, "
+                          f"using default {config[key]!r}", file=sys.stderr)
         
         return config
     
@@ -83,13 +179,18 @@ class VLLMHealthMonitor:
         log_dir = Path(self.config['MONITORING_ROOT']) / 'logs'
         log_dir.mkdir(parents=True, exist_ok=True)
         
-        log_file = log_dir / f"health-monitor-{datetime.now().strftime('%Y-%m-%d')}.log"
+        # Rotated at midnight to health-monitor.log.YYYY-MM-DD
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            log_dir / 'health-monitor.log',
+            when='midnight',
+            backupCount=self.config['RETAIN_LOGS_DAYS']
+        )
         
         logging.basicConfig(
             level=getattr(logging, self.config['LOG_LEVEL']),
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_file),
+                file_handler,
                 logging.StreamHandler(sys.stdout)
             ]
         )
@@ -98,44 +199,90 @@ class VLLMHealthMonitor:
     
     def setup_nvidia(self):
         """Initialize NVIDIA monitoring"""
+        self.gpu_handles = []
+        self.gpu_names = []
+        self.no_power_gpus = set()  # GPU indices whose driver does not report power
+        
         if NVIDIA_AVAILABLE:
             try:
                 pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
                 self.gpu_count = pynvml.nvmlDeviceGetCount()
+                
+                # Handles and names are fixed for the lifetime of the process
+                self.gpu_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(self.gpu_count)]
+                for handle in self.gpu_handles:
+                    name = pynvml.nvmlDeviceGetName(handle)
+                    self.gpu_names.append(name.decode('utf-8') if isinstance(name, bytes) else name)
+                
                 self.logger.info(f"Initialized NVIDIA monitoring for {self.gpu_count} GPUs")
             except Exception as e:
                 self.logger.error(f"Failed to initialize NVIDIA monitoring: {e}")
                 self.gpu_count = 0
+                self.gpu_handles = []
+                self.gpu_names = []
         else:
             self.logger.warning("NVIDIA monitoring not available (pynvml not installed)")
             self.gpu_count = 0
     
-    def check_api_health(self) -> Dict[str, Any]:
+    def setup_http(self):
+        """Create pooled HTTP sessions so checks reuse keep-alive connections"""
+        self.api_headers = {"Authorization": f"Bearer {self.config['API_KEY']}"}
+        
+        # API checks only talk to the vLLM endpoint, so skip per-request
+        # proxy/netrc lookups from the environment
+        self.session = requests.Session()
+        self.session.trust_env = False
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        
+        # Alert webhooks go to external services and may need proxy settings
+        self.alert_session = requests.Session()
+        self.alert_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        
+        # The /health and /v1/models probes are independent and run in parallel
+        self.api_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='api-probe')
+    
+    def timed_get(self, url: str, **kwargs):
+        """GET a URL through the API session, returning (response, elapsed seconds)"""
+        start_time = time.time()
+        response = self.session.get(url, **kwargs)
+        return response, time.time() - start_time
+    
+    def check_api_health(self, now: Optional[str] = None) -> Dict[str, Any]:
         """Check vLLM API health and response time"""
+        now = now or datetime.now().isoformat()
         try:
-            start_time = time.time()
-            
-            # Check /health endpoint
+            # Check /health and /models endpoints concurrently
             health_url = f"{self.config['API_ENDPOINT']}/health"
-            response = requests.get(health_url, timeout=10)
-            health_response_time = time.time() - start_time
+            models_url = f"{self.config['API_ENDPOINT']}/v1/models"
+            health_future = self.api_executor.submit(self.timed_get, health_url, timeout=10)
+            models_future = self.api_executor.submit(self.timed_get, models_url,
+                                                     headers=self.api_headers, timeout=10)
             
+            response, health_response_time = health_future.result()
             health_status = response.status_code == 200
             
-            # Check /models endpoint
-            start_time = time.time()
-            models_url = f"{self.config['API_ENDPOINT']}/v1/models"
-            headers = {"Authorization": f"Bearer {self.config['API_KEY']}"}
-            response = requests.get(models_url, headers=headers, timeout=10)
-            models_response_time = time.time() - start_time
-            
+            response, models_response_time = models_future.result()
             models_status = response.status_code == 200
             
-            # Test generation
-            generation_time = self.test_generation()
+            # Test generation, unless the server is already known to be down
+            generation_skipped = not (health_status and models_status) or self.generation_skip_cycles > 0
+            if generation_skipped:
+                generation_time = None
+                self.generation_skip_cycles = max(0, self.generation_skip_cycles - 1)
+            else:
+                generation_time = self.test_generation()
+                if generation_time is None:
+                    # Back off exponentially while generation keeps failing
+                    self.generation_failures += 1
+                    self.generation_skip_cycles = min(MAX_GENERATION_SKIP_CYCLES,
+                                                      2 ** (self.generation_failures - 1) - 1)
+                else:
+                    self.generation_failures = 0
             
             result = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now,
                 'health_endpoint': {
                     'status': health_status,
                     'response_time': health_response_time
@@ -146,7 +293,8 @@ class VLLMHealthMonitor:
                 },
                 'generation_test': {
                     'status': generation_time is not None,
-                    'response_time': generation_time
+                    'response_time': generation_time,
+                    'skipped': generation_skipped
                 },
                 'overall_status': health_status and models_status and generation_time is not None
             }
@@ -163,7 +311,7 @@ class VLLMHealthMonitor:
         except Exception as e:
             self.logger.error(f"API health check failed: {e}")
             return {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now,
                 'error': str(e),
                 'overall_status': False
             }
@@ -174,10 +322,6 @@ class VLLMHealthMonitor:
             start_time = time.time()
             
             url = f"{self.config['API_ENDPOINT']}/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.config['API_KEY']}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "model": "qwen3",
                 "messages": [{"role": "user", "content": "Say 'OK' if you're working."}],
@@ -185,7 +329,7 @@ class VLLMHealthMonitor:
                 "temperature": 0.1
             }
             
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = self.session.post(url, headers=self.api_headers, json=data, timeout=30)
             generation_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -198,20 +342,28 @@ class VLLMHealthMonitor:
             self.logger.error(f"Generation test failed: {e}")
             return None
     
-    def check_gpu_status(self) -> Dict[str, Any]:
+    def read_power_usage(self, index: int, handle) -> Optional[float]:
+        """Read GPU power draw in watts, skipping GPUs known not to report it"""
+        if index in self.no_power_gpus:
+            return None
+        try:
+            return pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # Convert to watts
+        except pynvml.NVMLError_NotSupported:
+            self.no_power_gpus.add(index)
+        except pynvml.NVMLError as e:
+            self.logger.warning(f"GPU {index} power query failed: {e}")
+        return None
+    
+    def check_gpu_status(self, now: Optional[str] = None) -> Dict[str, Any]:
         """Check GPU utilization, memory, and temperature"""
+        now = now or datetime.now().isoformat()
         if not NVIDIA_AVAILABLE or self.gpu_count == 0:
             return {'available': False, 'message': 'NVIDIA monitoring not available'}
         
         try:
             gpu_data = []
             
-            for i in range(self.gpu_count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                
-                # Get basic info
-                name = pynvml.nvmlDeviceGetName(handle).decode('utf-8')
-                
+            for i, (handle, name) in enumerate(zip(self.gpu_handles, self.gpu_names)):
                 # Memory info
                 mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
                 memory_used_percent = (mem_info.used / mem_info.total) * 100
@@ -223,10 +375,7 @@ class VLLMHealthMonitor:
                 util = pynvml.nvmlDeviceGetUtilizationRates(handle)
                 
                 # Power usage
-                try:
-                    power = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # Convert to watts
-                except:
-                    power = None
+                power_usage = self.read_power_usage(i, handle)
                 
                 gpu_info = {
                     'index': i,
@@ -241,20 +390,25 @@ class VLLMHealthMonitor:
                         'gpu': util.gpu,
                         'memory': util.memory
                     },
-                    'power_usage': power
+                    'power_usage': power_usage
                 }
                 
                 gpu_data.append(gpu_info)
-                
-                # Check thresholds
-                if memory_used_percent > self.config['GPU_MEMORY_THRESHOLD']:
-                    self.send_alert("GPU Memory High", f"GPU {i} memory usage: {memory_used_percent:.1f}%")
-                
-                if temp > self.config['GPU_TEMP_THRESHOLD']:
-                    self.send_alert("GPU Temperature High", f"GPU {i} temperature: {temp}°C")
+            
+            # Check thresholds, one alert per class covering all offending GPUs
+            memory_high = [gpu for gpu in gpu_data
+                           if gpu['memory']['used_percent'] > self.config['GPU_MEMORY_THRESHOLD']]
+            if memory_high:
+                details = ", ".join(f"GPU {gpu['index']}: {gpu['memory']['used_percent']:.1f}%" for gpu in memory_high)
+                self.send_alert("GPU Memory High", f"GPU memory usage - {details}")
+            
+            temp_high = [gpu for gpu in gpu_data if gpu['temperature'] > self.config['GPU_TEMP_THRESHOLD']]
+            if temp_high:
+                details = ", ".join(f"GPU {gpu['index']}: {gpu['temperature']}°C" for gpu in temp_high)
+                self.send_alert("GPU Temperature High", f"GPU temperature - {details}")
             
             return {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now,
                 'available': True,
                 'gpu_count': self.gpu_count,
                 'gpus': gpu_data
@@ -264,11 +418,18 @@ class VLLMHealthMonitor:
             self.logger.error(f"GPU status check failed: {e}")
             return {'available': True, 'error': str(e)}
     
-    def check_system_resources(self) -> Dict[str, Any]:
+    def check_system_resources(self, now: Optional[str] = None) -> Dict[str, Any]:
         """Check CPU, memory, and disk usage"""
+        now = now or datetime.now().isoformat()
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the last check (non-blocking). Right after
+            # startup, as with --check-once, wait until the window is long
+            # enough to mean anything.
+            elapsed = time.monotonic() - self.cpu_sampled_at
+            if elapsed < MIN_CPU_SAMPLE_SECONDS:
+                time.sleep(MIN_CPU_SAMPLE_SECONDS - elapsed)
+            cpu_percent = psutil.cpu_percent(interval=None)
+            self.cpu_sampled_at = time.monotonic()
             cpu_count = psutil.cpu_count()
             
             # Memory usage
@@ -291,7 +452,7 @@ class VLLMHealthMonitor:
                 load_avg = None
             
             result = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now,
                 'cpu': {
                     'usage_percent': cpu_percent,
                     'count': cpu_count,
@@ -334,26 +495,43 @@ class VLLMHealthMonitor:
             self.logger.error(f"System resource check failed: {e}")
             return {'error': str(e)}
     
-    def check_vllm_processes(self) -> Dict[str, Any]:
+    def check_vllm_processes(self, now: Optional[str] = None) -> Dict[str, Any]:
         """Check vLLM process status and resource usage"""
+        now = now or datetime.now().isoformat()
         try:
             vllm_processes = []
+            vllm_procs = {}
             
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cpu_percent', 'memory_percent', 'status']):
+            # Match on the raw NUL-separated cmdline bytes, which include
+            # argv[0]; only matching processes get a psutil.Process and
+            # have CPU, memory and status read
+            for pid in psutil.pids():
                 try:
-                    if 'vllm' in proc.info['name'].lower() or any('vllm' in arg.lower() for arg in proc.info['cmdline']):
+                    with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                        if b'vllm' not in f.read().lower():
+                            continue
+                    
+                    # Reuse the previous Process so cpu_percent covers the interval
+                    proc = self.vllm_procs.get(pid)
+                    if proc is None or not proc.is_running():
+                        proc = psutil.Process(pid)
+                    
+                    with proc.oneshot():
                         vllm_processes.append({
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'cpu_percent': proc.info['cpu_percent'],
-                            'memory_percent': proc.info['memory_percent'],
-                            'status': proc.info['status']
+                            'pid': pid,
+                            'name': proc.name(),
+                            'cpu_percent': proc.cpu_percent(),
+                            'memory_percent': proc.memory_percent(),
+                            'status': proc.status()
                         })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    vllm_procs[pid] = proc
+                except (OSError, psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
+            self.vllm_procs = vllm_procs
+            
             return {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now,
                 'process_count': len(vllm_processes),
                 'processes': vllm_processes
             }
@@ -364,15 +542,37 @@ class VLLMHealthMonitor:
     
     def send_alert(self, title: str, message: str):
         """Send alert notification"""
-        alert_key = f"{title}:{message}"
         current_time = time.time()
         
-        # Rate limiting: don't send same alert more than once per hour
-        if alert_key in self.alert_counts:
-            if current_time - self.alert_counts[alert_key] < 3600:
-                return
-        
-        self.alert_counts[alert_key] = current_time
+        # Rate limiting by title (messages carry changing readings). A
+        # condition that keeps firing backs off exponentially from
+        # ALERT_COOLDOWN up to ALERT_MAX_COOLDOWN. Checks run concurrently,
+        # so the check-and-set must be atomic.
+        with self.alert_lock:
+            last_sent, repeats = self.alert_counts.pop(title, (None, 0))
+            
+            if last_sent is not None:
+                cooldown = min(self.config['ALERT_MAX_COOLDOWN'],
+                               self.config['ALERT_COOLDOWN'] * 2 ** repeats)
+                elapsed = current_time - last_sent
+                
+                if elapsed < cooldown:
+                    self.alert_counts[title] = (last_sent, repeats)
+                    return
+                
+                # Quiet for two full windows: treat it as a new incident
+                repeats = repeats + 1 if elapsed < 2 * cooldown else 0
+            
+            self.alert_counts[title] = (current_time, repeats)
+            while len(self.alert_counts) > ALERT_HISTORY_SIZE:
+                self.alert_counts.popitem(last=False)
+            
+            # Expire alerts that have been quiet long enough to start over
+            # anyway, stopping before the entry just recorded (always last)
+            expiry = 2 * self.config['ALERT_MAX_COOLDOWN']
+            while (len(self.alert_counts) > 1
+                   and current_time - next(iter(self.alert_counts.values()))[0] >= expiry):
+                self.alert_counts.popitem(last=False)
         
         self.logger.warning(f"ALERT: {title} - {message}")
         
@@ -390,47 +590,126 @@ class VLLMHealthMonitor:
                         }]
                     }]
                 }
-                requests.post(self.config['SLACK_WEBHOOK'], json=payload, timeout=10)
+                self.alert_session.post(self.config['SLACK_WEBHOOK'], json=payload, timeout=10)
             except Exception as e:
                 self.logger.error(f"Failed to send Slack alert: {e}")
         
-        # Email notification (requires system mail configuration)
+        # Email notification (SMTP_HOST, or the system mail command)
         if self.config.get('ENABLE_EMAIL_ALERTS') and self.config.get('EMAIL_RECIPIENTS'):
             try:
                 subject = f"vLLM Alert: {title}"
                 body = f"Alert: {title}\nDetails: {message}\nTime: {datetime.now()}"
-                subprocess.run([
-                    'mail', '-s', subject, self.config['EMAIL_RECIPIENTS']
-                ], input=body, text=True, timeout=30)
+                if self.config['SMTP_HOST']:
+                    self.send_email(subject, body)
+                else:
+                    subprocess.run([
+                        'mail', '-s', subject, self.config['EMAIL_RECIPIENTS']
+                    ], input=body, text=True, timeout=30)
             except Exception as e:
                 self.logger.error(f"Failed to send email alert: {e}")
     
+    def get_smtp(self) -> smtplib.SMTP:
+        """Return the SMTP connection, connecting on first use"""
+        if self.smtp is None:
+            smtp = smtplib.SMTP(self.config['SMTP_HOST'], self.config['SMTP_PORT'], timeout=30)
+            if self.config['SMTP_STARTTLS']:
+                smtp.starttls()
+            if self.config['SMTP_USER']:
+                smtp.login(self.config['SMTP_USER'], self.config['SMTP_PASSWORD'])
+            self.smtp = smtp
+        
+        return self.smtp
+    
+    def send_email(self, subject: str, body: str):
+        """Send an email alert over the persistent SMTP connection"""
+        message = EmailMessage()
+        message['Subject'] = subject
+        message['From'] = self.config['SMTP_FROM'] or f"vllm-monitor@{socket.gethostname()}"
+        message['To'] = self.config['EMAIL_RECIPIENTS']
+        message.set_content(body)
+        
+        with self.smtp_lock:
+            try:
+                self.get_smtp().send_message(message)
+            except smtplib.SMTPServerDisconnected:
+                # Idle connections get dropped by the server; reconnect once
+                self.smtp = None
+                self.get_smtp().send_message(message)
+    
+    def close_smtp(self):
+        """Close the SMTP connection if one is open"""
+        with self.smtp_lock:
+            if self.smtp is not None:
+                try:
+                    self.smtp.quit()
+                except smtplib.SMTPException:
+                    pass
+                self.smtp = None
+    
     def save_metrics(self, metrics: Dict[str, Any]):
         """Save metrics to file for later analysis"""
-        metrics_dir = Path(self.config['MONITORING_ROOT']) / 'data'
-        metrics_dir.mkdir(parents=True, exist_ok=True)
-        
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        metrics_file = metrics_dir / f"metrics-{date_str}.jsonl"
+        today = date.today()
         
         try:
-            with open(metrics_file, 'a') as f:
-                json.dump(metrics, f)
-                f.write('\n')
+            # Rotate to a new file at midnight
+            if today != self.metrics_date:
+                self.close_metrics()
+                self.metrics_file = open(self.metrics_dir / f"metrics-{today.isoformat()}.jsonl", 'ab')
+                self.metrics_date = today
+            
+            if ORJSON_AVAILABLE:
+                line = orjson.dumps(metrics, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = json.dumps(metrics).encode('utf-8') + b'\n'
+            
+            self.metrics_file.write(line)
+            self.unflushed_records += 1
+            
+            # The dashboard reads the last line, so flush every record by default
+            if self.unflushed_records >= self.config['METRICS_FLUSH_RECORDS']:
+                self.metrics_file.flush()
+                self.unflushed_records = 0
         except Exception as e:
             self.logger.error(f"Failed to save metrics: {e}")
     
+    def close_metrics(self):
+        """Flush and close the current metrics file"""
+        if self.metrics_file:
+            self.metrics_file.close()
+            self.metrics_file = None
+            self.metrics_date = None
+            self.unflushed_records = 0
+    
     def run_health_check(self):
         """Run comprehensive health check"""
         self.logger.info("Starting health check cycle")
         
-        # Collect all metrics
+        # Collect all metrics; the checks are independent and I/O-bound,
+        # so run them concurrently and wait for the slowest one
+        timestamp = datetime.now().isoformat()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            api_future = executor.submit(self.check_api_health, timestamp)
+            gpu_future = executor.submit(self.check_gpu_status, timestamp)
+            system_future = executor.submit(self.check_system_resources, timestamp)
+            process_future = executor.submit(self.check_vllm_processes, timestamp)
+            
+            self.last_checks.update({
+                'api_health': api_future.result(),
+                'gpu_status': gpu_future.result(),
+                'system_resources': system_future.result(),
+                'vllm_processes': process_future.result()
+            })
+        
+        return self.record_metrics(timestamp)
+    
+    def record_metrics(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Save a metrics record built from the latest result of each check"""
         metrics = {
-            'timestamp': datetime.now().isoformat(),
-            'api_health': self.check_api_health(),
-            'gpu_status': self.check_gpu_status(),
-            'system_resources': self.check_system_resources(),
-            'vllm_processes': self.check_vllm_processes()
+            'timestamp': timestamp or datetime.now().isoformat(),
+            'api_health': self.last_checks.get('api_health', {}),
+            'gpu_status': self.last_checks.get('gpu_status', {}),
+            'system_resources': self.last_checks.get('system_resources', {}),
+            'vllm_processes': self.last_checks.get('vllm_processes', {})
         }
         
         # Save metrics
@@ -445,20 +724,60 @@ class VLLMHealthMonitor:
         
         return metrics
     
+    async def run_periodic(self, key: str, check, interval: float, record: bool = False):
+        """Run a check every `interval` seconds, measured from the schedule rather than completion"""
+        loop = asyncio.get_running_loop()
+        next_run = loop.time() + interval
+        
+        while True:
+            await asyncio.sleep(max(0.0, next_run - loop.time()))
+            
+            try:
+                # Checks block on HTTP, /proc and NVML, so keep them off the event loop
+                self.last_checks[key] = await loop.run_in_executor(None, check)
+                if record:
+                    await loop.run_in_executor(None, self.record_metrics)
+            except Exception as e:
+                self.logger.error(f"Scheduled {key} check failed: {e}")
+            
+            # Skip ticks missed while a slow check was running instead of bursting
+            next_run += interval
+            if next_run < loop.time():
+                next_run += ((loop.time() - next_run) // interval + 1) * interval
+    
+    async def monitor(self):
+        """Schedule each check at its configured interval"""
+        loop = asyncio.get_running_loop()
+        
+        # Seed every check so the first scheduled records are complete
+        await loop.run_in_executor(None, self.run_health_check)
+        
+        await asyncio.gather(
+            self.run_periodic('api_health', self.check_api_health,
+                              self.config['HEALTH_CHECK_INTERVAL'], record=True),
+            self.run_periodic('vllm_processes', self.check_vllm_processes,
+                              self.config['HEALTH_CHECK_INTERVAL']),
+            self.run_periodic('gpu_status', self.check_gpu_status,
+                              self.config['GPU_CHECK_INTERVAL']),
+            self.run_periodic('system_resources', self.check_system_resources,
+                              self.config['SYSTEM_CHECK_INTERVAL']),
+        )
+    
     def run_monitoring_loop(self):
         """Main monitoring loop"""
         self.logger.info("Starting vLLM health monitoring")
         
         try:
-            while True:
-                self.run_health_check()
-                time.sleep(self.config['HEALTH_CHECK_INTERVAL'])
+            asyncio.run(self.monitor())
                 
         except KeyboardInterrupt:
             self.logger.info("Monitoring stopped by user")
         except Exception as e:
             self.logger.error(f"Monitoring loop failed: {e}")
             raise
+        finally:
+            self.close_metrics()
+            self.close_smtp()
 
 def main():
     """Main entry point"""
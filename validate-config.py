@@ -5,95 +5,282 @@ This tool validates all configuration files, environment variables, and system r
 """
 
 import os
+import io
 import sys
 import json
 import subprocess
 import argparse
 import logging
+import logging.handlers
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple, Optional
 from dataclasses import dataclass
-import yaml
+from enum import IntEnum
 import re
+from collections import defaultdict
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson parses bytes directly and its JSONDecodeError subclasses json's
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+__version__ = "1.1.0"
+
+# Saved results for unchanged configuration trees (--cache)
+CACHE_DIR = Path.home() / ".cache" / "vllm-validate"
+
+# Non-placeholder SERVER_IP assignment in environment-template.sh
+_SERVER_IP_RE = re.compile(rb'export SERVER_IP="([^"]+)"')
+
+# Variables environment-template.sh must export, and placeholder values
+# that still need replacing; each is matched in a single bytes scan
+_REQUIRED_ENV_VARS = (
+    "VLLM_API_KEY",
+    "MODEL_PATH",
+    "MAX_MODEL_LENGTH",
+    "CUDA_VISIBLE_DEVICES",
+    "SERVER_IP",
+    "SSH_KEY"
+)
+_ENV_VAR_RE = re.compile(rb'export (' + '|'.join(_REQUIRED_ENV_VARS).encode() + rb')=')
+
+_PLACEHOLDERS = (
+    "YOUR_API_KEY_HERE",
+    "YOUR_SSH_KEY",
+    "YOUR_SERVER_IP"
+)
+_PLACEHOLDER_RE = re.compile('|'.join(_PLACEHOLDERS).encode())
+
+# SSH private key file names in ~/.ssh
+_SSH_KEY_RE = re.compile(r'^(id_|.*_(rsa|ed25519)$)')
+
+# Process exit code keyed by (any failures, any warnings): failures win
+_EXIT = {(True, True): 1, (True, False): 1, (False, True): 2, (False, False): 0}
+
+class Status(IntEnum):
+    """Validation result status; values index _ICONS, _LOG_LEVELS and status counts"""
+    PASS = 0
+    FAIL = 1
+    WARNING = 2
+    INFO = 3
+
+# Report icon and log level for each result status
+_ICONS = ("✅", "❌", "⚠️", "ℹ️")
+_LOG_LEVELS = (logging.INFO, logging.ERROR, logging.WARNING, logging.INFO)
+
+# Markdown written by ConfigValidator.write_report before and after the
+# per-category results
+_REPORT_HEADER = """
+# Configuration Validation Report
+
+**Generated:** {generated}
+**Total Checks:** {total}
+
+## Summary
+- ✅ **Passed:** {passed}
+- ❌ **Failed:** {failed} 
+- ⚠️  **Warnings:** {warnings}
+- ℹ️  **Info:** {info}
+
+## Detailed Results
+
+"""
+
+_REPORT_FOOTER = """## Recommendations
+
+{recommendations}
+## Next Steps
+
+{next_steps}"""
+
+_NEXT_STEPS_READY = """1. **Update Placeholders:** Replace any remaining placeholder values in configuration files
+2. **Test SSH Connection:** Verify SSH connectivity to your GPU server
+3. **Start vLLM Server:** Use the provided scripts to start the vLLM server
+4. **Test API Endpoints:** Verify API connectivity and model availability
+5. **Configure CRUSH:** Set up CRUSH with the validated configuration
+"""
+
+_NEXT_STEPS_FIX = """1. **Fix Critical Issues:** Address all failed checks first
+2. **Re-run Validation:** Run this validator again after fixes
+3. **Proceed with Setup:** Continue with next steps once validation passes
+"""
+
+@dataclass(slots=True)
 class ValidationResult:
     name: str
-    status: str  # 'pass', 'fail', 'warning', 'info'
+    status: Status
     message: str
     details: Optional[str] = None
 
+def _category_of(name: str) -> str:
+    """Report category for a result name: the part before " - ", else the first word"""
+    category, separator, _ = name.partition(' - ')
+    return category if separator else name.split(' ', 1)[0]
+
 class ConfigValidator:
     def __init__(self, config_dir: str = None):
         self.config_dir = Path(config_dir) if config_dir else Path(__file__).parent
+        self._configs_dir = self.config_dir / "configs"
+        self._scripts_dir = self.config_dir / "scripts"
+        self._home = Path.home()
+        self._ssh_dir = self._home / ".ssh"
         self.results: List[ValidationResult] = []
+        self.status_counts: List[int] = [0] * len(Status)
+        self._file_cache: Dict[Tuple[Path, str], Tuple[int, Any]] = {}
+        self._present: Dict[Path, Set[str]] = {}
+        self._local = threading.local()
+        self._log_lock = threading.Lock()
         self.setup_logging()
         
     def setup_logging(self):
+        self.logger = logging.getLogger(__name__)
+        
+        # Under pytest, leave logging to the test runner's capture handlers
+        if "PYTEST_CURRENT_TEST" in os.environ:
+            self.log_buffer = None
+            return
+            
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        file_handler = logging.FileHandler('config-validation.log')
+        file_handler.setFormatter(logging.Formatter(log_format))
+        
+        # Buffer log file writes; they are flushed on errors and at the end of validate_all
+        self.log_buffer = logging.handlers.MemoryHandler(
+            capacity=1000,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler('config-validation.log'),
+                self.log_buffer,
                 logging.StreamHandler()
             ]
         )
-        self.logger = logging.getLogger(__name__)
 
     def validate_all(self) -> List[ValidationResult]:
         """Run all validation checks"""
+        for batch in self._validate_all_iter():
+            self.results.extend(batch)
+        return self.results
+
+    def _validate_all_iter(self) -> Iterator[List[ValidationResult]]:
+        """Run all validation checks, yielding each group's results in order as it finishes"""
         self.logger.info("Starting comprehensive configuration validation...")
         
-        # Core configuration validation
-        self.validate_crush_config()
-        self.validate_environment_template()
-        self.validate_claude_settings()
-        
-        # System validation
-        self.validate_python_environment()
-        self.validate_gpu_requirements()
-        self.validate_network_configuration()
+        # Directory listings are taken fresh for each run
+        self._present.clear()
         
-        # Scripts validation
-        self.validate_scripts()
-        
-        # Integration validation
-        self.validate_api_connectivity()
-        self.validate_ssh_configuration()
+        # Most checks block on subprocesses, sockets or HTTP, so independent
+        # groups run concurrently. Validators sharing state run in one group.
+        groups = [
+            # Core configuration validation; the network check's SSH probe
+            # reuses the environment template read
+            (self.validate_crush_config,),
+            (self.validate_environment_template, self.validate_network_configuration),
+            (self.validate_claude_settings,),
+            
+            # System validation
+            (self.validate_python_environment,),
+            (self.validate_gpu_requirements,),
+            
+            # Scripts validation
+            (self.validate_scripts,),
+            
+            # Integration validation
+            (self.validate_api_connectivity,),
+            (self.validate_ssh_configuration,),
+        ]
         
-        return self.results
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(self._run_validators, *group) for group in groups]
+                for future in futures:
+                    yield future.result()
+        finally:
+            if self.log_buffer:
+                self.log_buffer.flush()
 
-    def add_result(self, name: str, status: str, message: str, details: str = None):
+    def _run_validators(self, *validators: Callable[[], None]) -> List[ValidationResult]:
+        """Run validators on the current thread and return the results they added"""
+        self._local.results = []
+        try:
+            for validator in validators:
+                validator()
+            return self._local.results
+        finally:
+            del self._local.results
+
+    def add_result(self, name: str, status: Status, message: str, details: str = None):
         """Add a validation result"""
         result = ValidationResult(name, status, message, details)
-        self.results.append(result)
         
-        log_level = {
-            'pass': logging.INFO,
-            'fail': logging.ERROR,
-            'warning': logging.WARNING,
-            'info': logging.INFO
-        }.get(status, logging.INFO)
+        # Validators running on the pool collect into a per-thread list
+        getattr(self._local, 'results', self.results).append(result)
         
-        self.logger.log(log_level, f"{name}: {message}")
-        if details:
-            self.logger.debug(f"Details: {details}")
+        with self._log_lock:
+            self.status_counts[status] += 1
+            self.logger.log(_LOG_LEVELS[status], f"{name}: {message}")
+            if details:
+                self.logger.debug(f"Details: {details}")
+
+    def _read_cached(self, path: Path, kind: str, parse: Callable[[bytes], Any]) -> Any:
+        """Read and parse a file, reusing the previous result until its mtime changes"""
+        mtime = path.stat().st_mtime_ns
+        cached = self._file_cache.get((path, kind))
+        if cached and cached[0] == mtime:
+            return cached[1]
+            
+        value = parse(path.read_bytes())
+        self._file_cache[(path, kind)] = (mtime, value)
+        return value
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """Read a file's raw bytes through the mtime-keyed cache"""
+        return self._read_cached(path, "bytes", bytes)
+
+    def _read_json(self, path: Path) -> Any:
+        """Read and parse a JSON file through the mtime-keyed cache"""
+        return self._read_cached(path, "json", _json_loads)
+
+    def _list(self, directory: Path) -> Set[str]:
+        """Return the entry names in a directory, listing it once per run"""
+        names = self._present.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                names = set()
+            self._present[directory] = names
+        return names
+
+    def _exists(self, path: Path) -> bool:
+        """Check for a path using the cached listing of its parent directory"""
+        return path.name in self._list(path.parent)
 
     def validate_crush_config(self):
         """Validate CRUSH configuration file"""
-        config_path = self.config_dir / "configs" / "crush-config.json"
+        config_path = self._configs_dir / "crush-config.json"
         
-        if not config_path.exists():
+        if not self._exists(config_path):
             self.add_result(
                 "CRUSH Config File",
-                "fail",
+                Status.FAIL,
                 f"Configuration file not found: {config_path}"
             )
             return
             
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            config = self._read_json(config_path)
                 
             # Validate schema
             required_fields = ["providers", "default_provider", "default_model"]
@@ -101,7 +288,7 @@ class ConfigValidator:
                 if field not in config:
                     self.add_result(
                         "CRUSH Config Schema",
-                        "fail",
+                        Status.FAIL,
                         f"Missing required field: {field}"
                     )
                     continue
@@ -111,7 +298,7 @@ class ConfigValidator:
             if "vllm-local" not in providers:
                 self.add_result(
                     "CRUSH Providers",
-                    "fail",
+                    Status.FAIL,
                     "Missing vllm-local provider configuration"
                 )
             else:
@@ -122,32 +309,32 @@ class ConfigValidator:
             if config.get("providers", {}).get("vllm-local", {}).get("api_key") == "YOUR_API_KEY_HERE":
                 self.add_result(
                     "CRUSH API Key",
-                    "warning",
+                    Status.WARNING,
                     "API key is still set to placeholder value"
                 )
             else:
                 self.add_result(
                     "CRUSH API Key",
-                    "pass",
+                    Status.PASS,
                     "API key has been configured"
                 )
                 
             self.add_result(
                 "CRUSH Config File",
-                "pass",
+                Status.PASS,
                 "Configuration file is valid"
             )
             
         except json.JSONDecodeError as e:
             self.add_result(
                 "CRUSH Config File",
-                "fail",
+                Status.FAIL,
                 f"Invalid JSON format: {e}"
             )
         except Exception as e:
             self.add_result(
                 "CRUSH Config File",
-                "fail",
+                Status.FAIL,
                 f"Error reading config: {e}"
             )
 
@@ -159,7 +346,7 @@ class ConfigValidator:
             if field not in provider:
                 self.add_result(
                     f"Provider Config - {field}",
-                    "fail",
+                    Status.FAIL,
                     f"Missing required field: {field}"
                 )
                 
@@ -168,13 +355,13 @@ class ConfigValidator:
         if not base_url.startswith(("http://", "https://")):
             self.add_result(
                 "Provider Base URL",
-                "fail",
+                Status.FAIL,
                 f"Invalid base_url format: {base_url}"
             )
         elif "localhost:8000" in base_url:
             self.add_result(
                 "Provider Base URL",
-                "pass",
+                Status.PASS,
                 "Base URL correctly configured for local vLLM"
             )
             
@@ -183,7 +370,7 @@ class ConfigValidator:
         if not models:
             self.add_result(
                 "Provider Models",
-                "fail",
+                Status.FAIL,
                 "No models configured"
             )
         else:
@@ -198,7 +385,7 @@ class ConfigValidator:
             if field not in model:
                 self.add_result(
                     f"Model Config - {field}",
-                    "fail",
+                    Status.FAIL,
                     f"Missing required field: {field}"
                 )
                 
@@ -207,99 +394,82 @@ class ConfigValidator:
         if context_window >= 200000:
             self.add_result(
                 "Model Context Window",
-                "pass",
+                Status.PASS,
                 f"Large context window configured: {context_window:,} tokens"
             )
         elif context_window > 0:
             self.add_result(
                 "Model Context Window",
-                "warning",
+                Status.WARNING,
                 f"Small context window: {context_window:,} tokens"
             )
 
     def validate_environment_template(self):
         """Validate environment template file"""
-        env_path = self.config_dir / "configs" / "environment-template.sh"
+        env_path = self._configs_dir / "environment-template.sh"
         
-        if not env_path.exists():
+        if not self._exists(env_path):
             self.add_result(
                 "Environment Template",
-                "fail",
+                Status.FAIL,
                 f"Environment template not found: {env_path}"
             )
             return
             
         try:
-            with open(env_path) as f:
-                content = f.read()
+            content = self._read_bytes(env_path)
                 
             # Check for required environment variables
-            required_vars = [
-                "VLLM_API_KEY",
-                "MODEL_PATH", 
-                "MAX_MODEL_LENGTH",
-                "CUDA_VISIBLE_DEVICES",
-                "SERVER_IP",
-                "SSH_KEY"
-            ]
+            defined_vars = {var.decode() for var in _ENV_VAR_RE.findall(content)}
             
-            for var in required_vars:
-                if f"export {var}=" in content:
+            for var in _REQUIRED_ENV_VARS:
+                if var in defined_vars:
                     self.add_result(
                         f"Environment Variable - {var}",
-                        "pass",
+                        Status.PASS,
                         f"Variable {var} is defined"
                     )
                 else:
                     self.add_result(
                         f"Environment Variable - {var}",
-                        "fail",
+                        Status.FAIL,
                         f"Missing environment variable: {var}"
                     )
                     
-            # Check for placeholder values
-            placeholders = [
-                "YOUR_API_KEY_HERE",
-                "YOUR_SSH_KEY", 
-                "YOUR_SERVER_IP"
-            ]
-            
-            placeholder_count = 0
-            for placeholder in placeholders:
-                if placeholder in content:
-                    placeholder_count += 1
+            # Check for placeholder values (count each distinct placeholder once)
+            placeholder_count = len(set(_PLACEHOLDER_RE.findall(content)))
                     
             if placeholder_count > 0:
                 self.add_result(
                     "Environment Placeholders",
-                    "warning",
+                    Status.WARNING,
                     f"Found {placeholder_count} placeholder values that need to be replaced"
                 )
             else:
                 self.add_result(
                     "Environment Placeholders",
-                    "pass",
+                    Status.PASS,
                     "No placeholder values found"
                 )
                 
             # Validate GPU memory utilization
-            if "GPU_MEMORY_UTILIZATION=0.95" in content:
+            if b"GPU_MEMORY_UTILIZATION=0.95" in content:
                 self.add_result(
                     "GPU Memory Utilization",
-                    "pass",
+                    Status.PASS,
                     "GPU memory utilization properly configured"
                 )
                 
             self.add_result(
                 "Environment Template",
-                "pass",
+                Status.PASS,
                 "Environment template file is valid"
             )
             
         except Exception as e:
             self.add_result(
                 "Environment Template",
-                "fail",
+                Status.FAIL,
                 f"Error reading environment template: {e}"
             )
 
@@ -307,17 +477,16 @@ class ConfigValidator:
         """Validate Claude settings configuration"""
         claude_path = self.config_dir / ".claude" / "settings.local.json"
         
-        if not claude_path.exists():
+        if not self._exists(claude_path):
             self.add_result(
                 "Claude Settings",
-                "warning",
+                Status.WARNING,
                 f"Claude settings file not found: {claude_path}"
             )
             return
             
         try:
-            with open(claude_path) as f:
-                settings = json.load(f)
+            settings = self._read_json(claude_path)
                 
             # Validate permissions structure
             if "permissions" in settings:
@@ -326,39 +495,39 @@ class ConfigValidator:
                 if "allow" in permissions and isinstance(permissions["allow"], list):
                     self.add_result(
                         "Claude Permissions - Allow",
-                        "pass",
+                        Status.PASS,
                         f"Found {len(permissions['allow'])} allowed permissions"
                     )
                     
                 if "deny" in permissions and isinstance(permissions["deny"], list):
                     self.add_result(
                         "Claude Permissions - Deny",
-                        "info",
+                        Status.INFO,
                         f"Found {len(permissions['deny'])} denied permissions"
                     )
                     
                 self.add_result(
                     "Claude Settings",
-                    "pass",
+                    Status.PASS,
                     "Claude settings file is valid"
                 )
             else:
                 self.add_result(
                     "Claude Settings",
-                    "warning",
+                    Status.WARNING,
                     "Missing permissions configuration"
                 )
                 
         except json.JSONDecodeError as e:
             self.add_result(
                 "Claude Settings",
-                "fail",
+                Status.FAIL,
                 f"Invalid JSON format: {e}"
             )
         except Exception as e:
             self.add_result(
                 "Claude Settings",
-                "fail",
+                Status.FAIL,
                 f"Error reading Claude settings: {e}"
             )
 
@@ -371,19 +540,19 @@ class ConfigValidator:
             if python_version >= (3, 10):
                 self.add_result(
                     "Python Version",
-                    "pass",
+                    Status.PASS,
                     f"Python {python_version.major}.{python_version.minor}.{python_version.micro}"
                 )
             else:
                 self.add_result(
                     "Python Version",
-                    "warning",
+                    Status.WARNING,
                     f"Python version may be too old: {python_version.major}.{python_version.minor}"
                 )
         except Exception as e:
             self.add_result(
                 "Python Version",
-                "fail",
+                Status.FAIL,
                 f"Could not determine Python version: {e}"
             )
             
@@ -391,13 +560,13 @@ class ConfigValidator:
         if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
             self.add_result(
                 "Virtual Environment",
-                "pass",
+                Status.PASS,
                 "Running in virtual environment"
             )
         else:
             self.add_result(
                 "Virtual Environment", 
-                "warning",
+                Status.WARNING,
                 "Not running in virtual environment"
             )
             
@@ -412,169 +581,169 @@ class ConfigValidator:
                 __import__(package)
                 self.add_result(
                     f"Package - {package}",
-                    "pass",
+                    Status.PASS,
                     f"Package {package} is available"
                 )
             except ImportError:
                 self.add_result(
                     f"Package - {package}",
-                    "warning",
+                    Status.WARNING,
                     f"Package {package} not found"
                 )
+                
+        # Optional packages only speed things up
+        if ORJSON_AVAILABLE:
+            self.add_result(
+                "Package - orjson",
+                Status.PASS,
+                "Package orjson is available for faster JSON parsing"
+            )
+        else:
+            self.add_result(
+                "Package - orjson",
+                Status.INFO,
+                "Package orjson not found, using the standard json module"
+            )
 
     def validate_gpu_requirements(self):
         """Validate GPU requirements (if nvidia-smi is available)"""
         try:
-            result = subprocess.run(['nvidia-smi', '--list-gpus'], 
-                                 capture_output=True, text=True, timeout=10)
+            # One query returns a "name, memory.total" line per GPU
+            result = subprocess.run([
+                'nvidia-smi', '--query-gpu=name,memory.total',
+                '--format=csv,noheader,nounits'
+            ], capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                gpu_lines = result.stdout.strip().split('\n')
-                gpu_count = len([line for line in gpu_lines if line.strip()])
+                # Count GPUs and sum their memory in one pass over the output
+                gpu_count = 0
+                total_memory = 0
+                for line in result.stdout.splitlines():
+                    if line.strip():
+                        gpu_count += 1
+                        total_memory += int(line.rsplit(',', 1)[1])
                 
                 if gpu_count >= 4:
                     self.add_result(
                         "GPU Count",
-                        "pass",
+                        Status.PASS,
                         f"Found {gpu_count} GPUs (meets requirement of 4+)"
                     )
                 else:
                     self.add_result(
                         "GPU Count",
-                        "warning",
+                        Status.WARNING,
                         f"Found {gpu_count} GPUs (recommended: 4+)"
                     )
                     
                 # Check GPU memory
-                memory_result = subprocess.run([
-                    'nvidia-smi', '--query-gpu=memory.total', 
-                    '--format=csv,noheader,nounits'
-                ], capture_output=True, text=True, timeout=10)
+                total_memory_gb = total_memory / 1024
                 
-                if memory_result.returncode == 0:
-                    memory_lines = memory_result.stdout.strip().split('\n')
-                    total_memory = 0
-                    for line in memory_lines:
-                        if line.strip():
-                            memory = int(line.strip())
-                            total_memory += memory
-                            
-                    total_memory_gb = total_memory / 1024
+                if total_memory_gb >= 500:  # 4x 125GB+ GPUs
+                    self.add_result(
+                        "GPU Memory",
+                        Status.PASS,
+                        f"Total GPU memory: {total_memory_gb:.1f}GB"
+                    )
+                else:
+                    self.add_result(
+                        "GPU Memory",
+                        Status.WARNING,
+                        f"Total GPU memory: {total_memory_gb:.1f}GB (recommended: 500GB+)"
+                    )
                     
-                    if total_memory_gb >= 500:  # 4x 125GB+ GPUs
-                        self.add_result(
-                            "GPU Memory",
-                            "pass",
-                            f"Total GPU memory: {total_memory_gb:.1f}GB"
-                        )
-                    else:
-                        self.add_result(
-                            "GPU Memory",
-                            "warning",
-                            f"Total GPU memory: {total_memory_gb:.1f}GB (recommended: 500GB+)"
-                        )
-                        
             else:
                 self.add_result(
                     "GPU Detection",
-                    "info",
+                    Status.INFO,
                     "nvidia-smi not available or no GPUs found"
                 )
                 
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
             self.add_result(
                 "GPU Detection",
-                "info",
+                Status.INFO,
                 "Could not check GPU status (nvidia-smi not available)"
             )
 
     def validate_network_configuration(self):
         """Validate network configuration and ports"""
+        import asyncio
         
-        # Check if port 8000 is available or in use
-        try:
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex(('localhost', 8000))
-            sock.close()
+        # The port check and the SSH server probe (if SERVER_IP is
+        # configured) are independent waits, so run them on one event loop
+        async def probe_all():
+            return await asyncio.gather(self._probe_vllm_port(), self._probe_server())
             
-            if result == 0:
-                self.add_result(
-                    "vLLM Port (8000)",
-                    "info",
-                    "Port 8000 is in use (vLLM may be running)"
-                )
-            else:
-                self.add_result(
-                    "vLLM Port (8000)",
-                    "pass",
-                    "Port 8000 is available"
-                )
-                
+        port_result, server_result = asyncio.run(probe_all())
+        
+        self.add_result("vLLM Port (8000)", *port_result)
+        if server_result:
+            self.add_result("Server Connectivity", *server_result)
+
+    async def _probe_vllm_port(self) -> Tuple[Status, str]:
+        """Check whether port 8000 is in use, returning (status, message)"""
+        import asyncio
+        
+        # A closed local port is refused immediately, so a short timeout only
+        # bounds a wedged stack
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', 8000), timeout=0.5)
+            writer.close()
+            return Status.INFO, "Port 8000 is in use (vLLM may be running)"
+        except (ConnectionRefusedError, asyncio.TimeoutError):
+            return Status.PASS, "Port 8000 is available"
         except Exception as e:
-            self.add_result(
-                "vLLM Port (8000)",
-                "warning",
-                f"Could not check port status: {e}"
-            )
-            
-        # Check SSH connectivity (if SERVER_IP is configured)
-        self.check_ssh_connectivity()
+            return Status.WARNING, f"Could not check port status: {e}"
 
-    def check_ssh_connectivity(self):
-        """Check SSH connectivity to configured server"""
+    async def _probe_server(self) -> Optional[Tuple[Status, str]]:
+        """Probe SSH on the configured server, returning (status, message) or None if not configured"""
+        import asyncio
+        
         try:
-            env_path = self.config_dir / "configs" / "environment-template.sh"
-            if not env_path.exists():
-                return
+            env_path = self._configs_dir / "environment-template.sh"
+            if not self._exists(env_path):
+                return None
                 
-            with open(env_path) as f:
-                content = f.read()
+            content = self._read_bytes(env_path)
                 
             # Extract server IP (look for non-placeholder value)
-            server_ip_match = re.search(r'export SERVER_IP="([^"]+)"', content)
-            if server_ip_match:
-                server_ip = server_ip_match.group(1)
-                if server_ip != "YOUR_SERVER_IP":
-                    # Try to ping the server
-                    try:
-                        result = subprocess.run(['ping', '-c', '1', '-W', '3', server_ip], 
-                                             capture_output=True, timeout=10)
-                        if result.returncode == 0:
-                            self.add_result(
-                                "Server Connectivity",
-                                "pass",
-                                f"Server {server_ip} is reachable"
-                            )
-                        else:
-                            self.add_result(
-                                "Server Connectivity",
-                                "warning",
-                                f"Server {server_ip} is not reachable"
-                            )
-                    except (subprocess.TimeoutExpired, FileNotFoundError):
-                        self.add_result(
-                            "Server Connectivity",
-                            "info",
-                            f"Could not check connectivity to {server_ip}"
-                        )
-                        
+            server_ip_match = _SERVER_IP_RE.search(content)
+            if not server_ip_match:
+                return None
+                
+            server_ip = server_ip_match.group(1).decode()
+            if server_ip == "YOUR_SERVER_IP":
+                return None
+                
+            # Connect to the SSH port; this is what setup needs and avoids
+            # forking ping
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(server_ip, 22), timeout=1.0)
+                writer.close()
+                return Status.PASS, f"Server {server_ip} is reachable on SSH port 22"
+            except (OSError, asyncio.TimeoutError):
+                return Status.WARNING, f"Server {server_ip} is not reachable on SSH port 22"
+                
         except Exception as e:
-            self.add_result(
-                "Server Connectivity",
-                "info",
-                f"Could not check server connectivity: {e}"
-            )
+            return Status.INFO, f"Could not check server connectivity: {e}"
+
+    def check_ssh_connectivity(self):
+        """Check SSH connectivity to configured server"""
+        import asyncio
+        
+        result = asyncio.run(self._probe_server())
+        if result:
+            self.add_result("Server Connectivity", *result)
 
     def validate_scripts(self):
         """Validate script files"""
-        scripts_dir = self.config_dir / "scripts"
+        scripts_dir = self._scripts_dir
         
-        if not scripts_dir.exists():
+        if not self._exists(scripts_dir):
             self.add_result(
                 "Scripts Directory",
-                "warning",
+                Status.WARNING,
                 f"Scripts directory not found: {scripts_dir}"
             )
             return
@@ -589,63 +758,62 @@ class ConfigValidator:
         script_count = 0
         for script_path in key_scripts:
             full_path = scripts_dir / script_path
-            if full_path.exists():
+            if self._exists(full_path):
                 script_count += 1
                 self.validate_script_file(full_path)
             else:
                 self.add_result(
                     f"Script - {script_path}",
-                    "warning",
+                    Status.WARNING,
                     f"Script not found: {script_path}"
                 )
                 
         if script_count > 0:
             self.add_result(
                 "Scripts Directory",
-                "pass",
+                Status.PASS,
                 f"Found {script_count} key scripts"
             )
 
     def validate_script_file(self, script_path: Path):
         """Validate individual script file"""
         try:
-            with open(script_path) as f:
-                content = f.read()
+            content = script_path.read_bytes()
                 
             # Check for executable permission
             if os.access(script_path, os.X_OK):
                 self.add_result(
                     f"Script Permissions - {script_path.name}",
-                    "pass",
+                    Status.PASS,
                     "Script is executable"
                 )
             else:
                 self.add_result(
                     f"Script Permissions - {script_path.name}",
-                    "warning",
+                    Status.WARNING,
                     "Script is not executable"
                 )
                 
             # Check for API key placeholder
-            if "YOUR_API_KEY_HERE" in content:
+            if b"YOUR_API_KEY_HERE" in content:
                 self.add_result(
                     f"Script API Key - {script_path.name}",
-                    "warning",
+                    Status.WARNING,
                     "Script contains API key placeholder"
                 )
                 
             # Check for vLLM serve command
-            if "vllm serve" in content:
+            if b"vllm serve" in content:
                 self.add_result(
                     f"Script Content - {script_path.name}",
-                    "pass",
+                    Status.PASS,
                     "Script contains vLLM serve command"
                 )
                 
         except Exception as e:
             self.add_result(
                 f"Script - {script_path.name}",
-                "fail",
+                Status.FAIL,
                 f"Error reading script: {e}"
             )
 
@@ -653,223 +821,308 @@ class ConfigValidator:
         """Test API connectivity"""
         try:
             import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            self.add_result(
+                "API Testing",
+                Status.WARNING,
+                "requests package not available for API testing"
+            )
+            return
+            
+        # Both probes share one pooled connection; connects fail fast, reads
+        # get the usual 5s
+        timeout = (0.5, 5)
+        with requests.Session() as session:
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
             
             # Test local vLLM endpoint
+            vllm_up = True
             try:
-                response = requests.get("http://localhost:8000/health", timeout=5)
+                response = session.get("http://127.0.0.1:8000/health", timeout=timeout)
                 if response.status_code == 200:
                     self.add_result(
                         "vLLM API Health",
-                        "pass",
+                        Status.PASS,
                         "vLLM API is responding"
                     )
                 else:
                     self.add_result(
                         "vLLM API Health",
-                        "warning",
+                        Status.WARNING,
                         f"vLLM API returned status {response.status_code}"
                     )
             except requests.ConnectionError:
+                vllm_up = False
                 self.add_result(
                     "vLLM API Health",
-                    "info",
+                    Status.INFO,
                     "vLLM API is not running (connection refused)"
                 )
             except requests.Timeout:
                 self.add_result(
                     "vLLM API Health",
-                    "warning",
+                    Status.WARNING,
                     "vLLM API timeout (may be starting up)"
                 )
                 
-            # Test models endpoint
+            # Test models endpoint; it cannot answer if the server is down
+            if not vllm_up:
+                self.add_result(
+                    "vLLM Models Endpoint",
+                    Status.INFO,
+                    "Models endpoint not checked (vLLM API is not running)"
+                )
+                return
+                
             try:
-                response = requests.get("http://localhost:8000/v1/models", timeout=5)
+                response = session.get("http://127.0.0.1:8000/v1/models", timeout=timeout)
                 if response.status_code == 200:
                     models = response.json()
                     model_count = len(models.get('data', []))
                     self.add_result(
                         "vLLM Models Endpoint",
-                        "pass",
+                        Status.PASS,
                         f"Found {model_count} available models"
                     )
                 else:
                     self.add_result(
                         "vLLM Models Endpoint",
-                        "info",
+                        Status.INFO,
                         f"Models endpoint returned status {response.status_code}"
                     )
             except (requests.ConnectionError, requests.Timeout):
                 self.add_result(
                     "vLLM Models Endpoint",
-                    "info",
+                    Status.INFO,
                     "Models endpoint not accessible"
                 )
-                
-        except ImportError:
-            self.add_result(
-                "API Testing",
-                "warning",
-                "requests package not available for API testing"
-            )
 
     def validate_ssh_configuration(self):
         """Validate SSH configuration"""
         
         # Check for SSH key existence
-        ssh_dir = Path.home() / ".ssh"
+        ssh_dir = self._ssh_dir
         if ssh_dir.exists():
-            key_files = list(ssh_dir.glob("id_*"))
-            key_files.extend(ssh_dir.glob("*_rsa"))
-            key_files.extend(ssh_dir.glob("*_ed25519"))
+            with os.scandir(ssh_dir) as entries:
+                key_files = [
+                    entry.name for entry in entries
+                    if _SSH_KEY_RE.match(entry.name) and entry.is_file()
+                ]
             
             if key_files:
                 self.add_result(
                     "SSH Keys",
-                    "pass",
+                    Status.PASS,
                     f"Found {len(key_files)} SSH key files"
                 )
             else:
                 self.add_result(
                     "SSH Keys",
-                    "warning",
+                    Status.WARNING,
                     "No SSH key files found in ~/.ssh"
                 )
         else:
             self.add_result(
                 "SSH Directory",
-                "warning",
+                Status.WARNING,
                 "SSH directory ~/.ssh not found"
             )
             
         # Check SSH config
-        ssh_config = Path.home() / ".ssh" / "config"
+        ssh_config = self._ssh_dir / "config"
         if ssh_config.exists():
             self.add_result(
                 "SSH Config",
-                "pass",
+                Status.PASS,
                 "SSH config file exists"
             )
         else:
             self.add_result(
                 "SSH Config", 
-                "info",
+                Status.INFO,
                 "SSH config file not found (optional)"
             )
 
     def generate_report(self) -> str:
         """Generate a comprehensive validation report"""
-        
-        # Count results by status
-        status_counts = {"pass": 0, "fail": 0, "warning": 0, "info": 0}
-        for result in self.results:
-            status_counts[result.status] += 1
-            
-        # Generate report
-        report = f"""
-# Configuration Validation Report
-
-**Generated:** {subprocess.check_output(['date'], text=True).strip()}
-**Total Checks:** {len(self.results)}
-
-## Summary
-- ✅ **Passed:** {status_counts['pass']}
-- ❌ **Failed:** {status_counts['fail']} 
-- ⚠️  **Warnings:** {status_counts['warning']}
-- ℹ️  **Info:** {status_counts['info']}
-
-## Detailed Results
+        with io.BytesIO() as report:
+            self.write_report(report)
+            return report.getvalue().decode('utf-8')
 
-"""
+    def write_report(self, fp):
+        """Write the validation report as UTF-8 to an open binary file, section by section"""
         
-        # Group results by category
-        categories = {}
+        # Group results by category; status counts are kept by add_result
+        status_counts = self.status_counts
+        categories = defaultdict(list)
         for result in self.results:
-            category = result.name.split(' - ')[0] if ' - ' in result.name else result.name.split(' ')[0]
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(result)
+            categories[_category_of(result.name)].append(result)
             
+        fail_count = status_counts[Status.FAIL]
+        warning_count = status_counts[Status.WARNING]
+        
+        fp.write(_REPORT_HEADER.format(
+            generated=datetime.now().astimezone().strftime('%a %b %d %H:%M:%S %Z %Y'),
+            total=len(self.results),
+            passed=status_counts[Status.PASS],
+            failed=fail_count,
+            warnings=warning_count,
+            info=status_counts[Status.INFO]
+        ).encode('utf-8'))
+        
+        # Write the per-category results, encoding each section once
         for category, results in sorted(categories.items()):
-            report += f"### {category}\n\n"
+            section = [f"### {category}\n\n"]
             
             for result in results:
-                icon = {"pass": "✅", "fail": "❌", "warning": "⚠️", "info": "ℹ️"}[result.status]
-                report += f"- {icon} **{result.name}:** {result.message}\n"
+                icon = _ICONS[result.status]
+                section.append(f"- {icon} **{result.name}:** {result.message}\n")
                 if result.details:
-                    report += f"  - *Details:* {result.details}\n"
+                    section.append(f"  - *Details:* {result.details}\n")
                     
-            report += "\n"
+            section.append("\n")
+            fp.write(''.join(section).encode('utf-8'))
             
         # Add recommendations section
-        fail_count = status_counts['fail']
-        warning_count = status_counts['warning']
-        
-        report += "## Recommendations\n\n"
-        
         if fail_count == 0 and warning_count == 0:
-            report += "🎉 **Excellent!** All checks passed. Your configuration appears to be ready for deployment.\n"
+            recommendations = "🎉 **Excellent!** All checks passed. Your configuration appears to be ready for deployment.\n"
         elif fail_count == 0:
-            report += f"✨ **Good!** No critical issues found. Please review the {warning_count} warnings above.\n"
+            recommendations = f"✨ **Good!** No critical issues found. Please review the {warning_count} warnings above.\n"
         else:
-            report += f"🔧 **Action Required:** Please address the {fail_count} failed checks before proceeding.\n"
+            recommendations = f"🔧 **Action Required:** Please address the {fail_count} failed checks before proceeding.\n"
             
         if warning_count > 0:
-            report += f"📝 **Note:** The {warning_count} warnings should be reviewed but may not prevent operation.\n"
+            recommendations += f"📝 **Note:** The {warning_count} warnings should be reviewed but may not prevent operation.\n"
             
-        report += "\n## Next Steps\n\n"
+        fp.write(_REPORT_FOOTER.format(
+            recommendations=recommendations,
+            next_steps=_NEXT_STEPS_READY if fail_count == 0 else _NEXT_STEPS_FIX
+        ).encode('utf-8'))
+
+def _scan_stats(directory: str, base: Path, entries: List[Tuple[str, int, int]]):
+    """Collect (relative path, size, mtime_ns) for every file below a directory.
+    
+    A missing directory contributes nothing; any other OSError propagates.
+    """
+    try:
+        it = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _scan_stats(entry.path, base, entries)
+            else:
+                # Follow symlinks so edits to their targets count; a dangling
+                # link is fingerprinted as the link itself
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    st = entry.stat(follow_symlinks=False)
+                entries.append((os.path.relpath(entry.path, base), st.st_size, st.st_mtime_ns))
+
+def _cache_path(config_dir: Path) -> Optional[Path]:
+    """Cache file named after a fingerprint of the validator and the files it reads.
+    
+    Returns None, so the run goes uncached, if the files cannot all be stat-ed.
+    """
+    import hashlib
+    
+    try:
+        st = os.stat(__file__)
+        entries = [("validate-config.py", st.st_size, st.st_mtime_ns)]
+        for subdir in ("configs", "scripts", ".claude"):
+            _scan_stats(config_dir / subdir, config_dir, entries)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Not using the validation cache, could not fingerprint {config_dir}: {e}")
+        return None
         
-        if fail_count == 0:
-            report += """1. **Update Placeholders:** Replace any remaining placeholder values in configuration files
-2. **Test SSH Connection:** Verify SSH connectivity to your GPU server
-3. **Start vLLM Server:** Use the provided scripts to start the vLLM server
-4. **Test API Endpoints:** Verify API connectivity and model availability
-5. **Configure CRUSH:** Set up CRUSH with the validated configuration
-"""
-        else:
-            report += """1. **Fix Critical Issues:** Address all failed checks first
-2. **Re-run Validation:** Run this validator again after fixes
-3. **Proceed with Setup:** Continue with next steps once validation passes
-"""
-            
-        return report
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    for entry in sorted(entries):
+        digest.update(repr(entry).encode())
+    return CACHE_DIR / f"{digest.hexdigest()}.pkl"
+
+def _load_cache(cache_path: Path) -> Optional[Tuple[List[ValidationResult], List[int]]]:
+    """Load (results, status counts) saved by _save_cache, or None if unavailable"""
+    import pickle
+    
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Ignoring unreadable validation cache {cache_path}: {e}")
+        return None
+
+def _save_cache(cache_path: Path, cached: Tuple[List[ValidationResult], List[int]]):
+    """Atomically save (results, status counts) for _load_cache"""
+    import pickle
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(cached, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Could not save validation cache {cache_path}: {e}")
 
 def main():
     parser = argparse.ArgumentParser(description="Validate vLLM + CRUSH configuration")
     parser.add_argument("--config-dir", help="Configuration directory path")
     parser.add_argument("--output", help="Output report file", default="validation-report.md")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--no-report", action="store_true",
+                        help="Only run the checks and set the exit code; do not write a report")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse all results from a previous run if no config or script file changed. "
+                             "Live checks (Python packages and virtualenv, GPU, port, server, vLLM API "
+                             "and ~/.ssh) are replayed from that run, not re-run")
     
     args = parser.parse_args()
     
+    # Writing to the null device is the same as asking for no report
+    if args.output == os.devnull:
+        args.no_report = True
+        
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         
     validator = ConfigValidator(args.config_dir)
-    results = validator.validate_all()
     
-    # Generate and save report
-    report = validator.generate_report()
+    cache_path = _cache_path(validator.config_dir) if args.cache else None
+    cached = _load_cache(cache_path) if cache_path else None
     
-    with open(args.output, 'w') as f:
-        f.write(report)
-        
-    print(f"\n📋 Validation complete! Report saved to: {args.output}")
+    if cached:
+        validator.results, validator.status_counts = cached
+        validator.logger.info(f"Using cached validation results from {cache_path}")
+    else:
+        validator.validate_all()
+        if cache_path:
+            _save_cache(cache_path, (validator.results, validator.status_counts))
     
-    # Print summary
-    status_counts = {"pass": 0, "fail": 0, "warning": 0, "info": 0}
-    for result in results:
-        status_counts[result.status] += 1
+    # Generate and save report
+    if args.no_report:
+        saved = ""
+    else:
+        with open(args.output, 'wb', buffering=1 << 20) as f:
+            validator.write_report(f)
+        saved = f" Report saved to: {args.output}"
         
-    print(f"📊 Summary: {status_counts['pass']} passed, {status_counts['fail']} failed, {status_counts['warning']} warnings")
+    # Print completion line and summary in one write
+    status_counts = validator.status_counts
+    sys.stdout.write(
+        f"\n📋 Validation complete!{saved}\n"
+        f"📊 Summary: {status_counts[Status.PASS]} passed, {status_counts[Status.FAIL]} failed, "
+        f"{status_counts[Status.WARNING]} warnings\n"
+    )
+    sys.stdout.flush()
     
     # Exit with appropriate code
-    if status_counts['fail'] > 0:
-        sys.exit(1)
-    elif status_counts['warning'] > 0:
-        sys.exit(2)
-    else:
-        sys.exit(0)
+    sys.exit(_EXIT[bool(status_counts[Status.FAIL]), bool(status_counts[Status.WARNING])])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file